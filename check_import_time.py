@@ -0,0 +1,40 @@
+"""
+量測每個進入點的匯入時間，超過預算就以非零狀態碼結束。
+每個模組都在各自目錄下的新程序中匯入，與實際執行方式相同；
+匯入時不應建立網路連線或讀取大型資料檔。
+"""
+import os
+import sys
+import subprocess
+
+# (目錄, 模組, 匯入時間預算（秒）)
+IMPORT_BUDGETS = [
+    ("dialogue_simulations", "run_simulations", 0.5),
+    ("dialogue_simulations", "patient", 0.5),
+    ("dialogue_simulations", "doctor", 0.5),
+    ("knowledge_graph", "build_graph", 0.5),
+    ("knowledge_graph", "run_search", 0.5),
+    ("patient_generation", "patient_gen", 0.5),
+]
+
+MEASURE = "import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+
+def measure_import_time(directory: str, module: str) -> float:
+    root = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE.format(module=module)],
+        cwd=os.path.join(root, directory),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+if __name__ == "__main__":
+    failed = False
+    for directory, module, budget in IMPORT_BUDGETS:
+        elapsed = measure_import_time(directory, module)
+        status = "OK" if elapsed <= budget else "OVER"
+        failed = failed or elapsed > budget
+        print(f"{status:4} {directory}/{module}: {elapsed * 1000:.1f} ms (budget {budget * 1000:.0f} ms)")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,135 @@
+"""
+病歷快取庫：把一個目錄的病歷 JSON 一次整理成單一 SQLite 索引檔，
+並預先渲染好提示詞使用的病歷字串。
+模擬程序以唯讀、記憶體映射的方式開啟同一個檔案，依 case id 延遲讀取，
+不必每次模擬都重新解析 JSON。
+"""
+import os
+import json
+import sqlite3
+
+MMAP_SIZE = 256 * 1024 * 1024
+
+def nested_dict_to_string(data_dict, indent=0):
+    """
+    將字典轉換為帶有縮排的字串。
+    """
+    lines = []
+    indent_space = '  ' * indent
+    for key, value in data_dict.items():
+        if isinstance(value, dict):
+            lines.append(f"{indent_space}{key}:")
+            lines.append(nested_dict_to_string(value, indent + 1))
+        else:
+            lines.append(f"{indent_space}{key}: {value}")
+    return '\n'.join(lines)
+
+def render_case_file(file_path: str) -> str:
+    """
+    讀取病歷 JSON 並轉換成提示詞使用的字串。
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return nested_dict_to_string(data["report"])
+
+def build_case_store(case_dir: str, db_path: str) -> int:
+    """
+    將目錄中的病歷 JSON 寫入 SQLite 索引檔，只重新渲染有變動的檔案。
+    :param case_dir: 病歷 JSON 所在目錄，檔名（不含副檔名）即為 case id
+    :param db_path: 索引檔路徑
+    :return: 這次重新渲染的病歷數量
+    """
+    if not os.path.isdir(case_dir):
+        raise FileNotFoundError(f"找不到目錄: {case_dir}")
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cases ("
+            "case_id TEXT PRIMARY KEY, mtime REAL NOT NULL, content TEXT NOT NULL)"
+        )
+        known = dict(conn.execute("SELECT case_id, mtime FROM cases"))
+
+        seen = set()
+        updated = 0
+        for file_name in sorted(os.listdir(case_dir)):
+            if not file_name.endswith('.json'):
+                continue
+            case_id = file_name[:-len('.json')]
+            file_path = os.path.join(case_dir, file_name)
+            mtime = os.path.getmtime(file_path)
+            seen.add(case_id)
+            if known.get(case_id) == mtime:
+                continue
+            conn.execute(
+                "INSERT OR REPLACE INTO cases (case_id, mtime, content) VALUES (?, ?, ?)",
+                (case_id, mtime, render_case_file(file_path))
+            )
+            updated += 1
+
+        # 移除已被刪除的病歷
+        removed = [(case_id,) for case_id in known if case_id not in seen]
+        conn.executemany("DELETE FROM cases WHERE case_id = ?", removed)
+        conn.commit()
+    finally:
+        conn.close()
+    return updated
+
+class CaseStore:
+    """
+    以 case id 延遲讀取預先渲染好的病歷字串。
+    """
+    def __init__(self, db_path: str):
+        """
+        :param db_path: build_case_store 產生的索引檔路徑
+        """
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"找不到檔案: {db_path}")
+        self.db_path = db_path
+        self._conn = None
+        self._cache = {}
+
+    @classmethod
+    def from_directory(cls, case_dir: str, db_path: str) -> "CaseStore":
+        """
+        建立（或更新）目錄對應的索引檔後開啟。
+        :param case_dir: 病歷 JSON 所在目錄
+        :param db_path: 索引檔路徑，應放在病歷目錄之外，避免與原始病歷混在一起
+        """
+        build_case_store(case_dir, db_path)
+        return cls(db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 第一次存取時才開啟連線；唯讀並以 mmap 讀取，讓多個程序共用作業系統的頁面快取
+        if self._conn is None:
+            self._conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            self._conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        return self._conn
+
+    def case_ids(self) -> list:
+        return [row[0] for row in self._connect().execute("SELECT case_id FROM cases ORDER BY case_id")]
+
+    def get(self, case_id: str) -> str:
+        if case_id not in self._cache:
+            row = self._connect().execute(
+                "SELECT content FROM cases WHERE case_id = ?", (case_id,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"找不到病歷: {case_id}")
+            self._cache[case_id] = row[0]
+        return self._cache[case_id]
+
+    def __contains__(self, case_id: str) -> bool:
+        try:
+            self.get(case_id)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM cases").fetchone()[0]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
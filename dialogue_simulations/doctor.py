@@ -1,8 +1,10 @@
 import os
 import json
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
-from llm import text_llm as llm 
+from typing import TYPE_CHECKING
+from llm import get_text_llm
+
+if TYPE_CHECKING:
+    from langchain_core.prompts import ChatPromptTemplate
 
 DOCTOR_TEMPLATE = """
 您將扮演一個醫師。請持續詢問病患問題，收集資訊並進行鑑別診斷。
@@ -23,9 +25,11 @@ class Doctor:
         :param case_file_path: 案例檔案的路徑
         """
         self.prompt_template = self._get_prompt_template()
-        self.chain = self.prompt_template | llm | StrOutputParser()
+        from langchain_core.output_parsers import StrOutputParser
+        self.chain = self.prompt_template | get_text_llm() | StrOutputParser()
 
-    def _get_prompt_template(self) -> ChatPromptTemplate:
+    def _get_prompt_template(self) -> "ChatPromptTemplate":
+        from langchain_core.prompts import ChatPromptTemplate
         template = DOCTOR_TEMPLATE
         return ChatPromptTemplate.from_template(template)
 
@@ -1,20 +1,31 @@
 """
 用兩個 LLM，一個專門處理 JSON 輸出，另一個處理純文字對話
 format="json" 會強制模型輸出有效的 JSON，非常適合需要結構化輸出的節點
+模型客戶端在第一次使用時才建立，匯入此模組不會載入 langchain_ollama 或連線。
 """
 import os
-from langchain_ollama import ChatOllama
+from functools import lru_cache
 
-gemma3 = ChatOllama(base_url="http://10.65.51.226:11434",model="gemma3:4b",temperature=0.2)
-gemma3_json = gemma3.bind(format="json")
+@lru_cache(maxsize=None)
+def get_text_llm():
+    from langchain_ollama import ChatOllama
+    return ChatOllama(base_url="http://10.65.51.226:11434",model="gemma3:4b",temperature=0.2)
 
-text_llm = gemma3
-json_llm = gemma3_json
+@lru_cache(maxsize=None)
+def get_json_llm():
+    return get_text_llm().bind(format="json")
+
+def __getattr__(name):
+    # 保留舊的 text_llm / json_llm 名稱，存取時才建立客戶端
+    if name == "text_llm":
+        return get_text_llm()
+    if name == "json_llm":
+        return get_json_llm()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
-    resp = text_llm.invoke("說一個電腦科學的笑話")
+    resp = get_text_llm().invoke("說一個電腦科學的笑話")
     print(resp.content)
     print("-"*100)
-    resp = json_llm.invoke("Tell me a joke, following this json form: {'content': 'joke content', 'point': 'explain the funny point of the joke'}")
+    resp = get_json_llm().invoke("Tell me a joke, following this json form: {'content': 'joke content', 'point': 'explain the funny point of the joke'}")
     print(resp.content)
-
@@ -1,8 +1,10 @@
 import os
-import json
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
-from llm import text_llm as llm 
+from typing import TYPE_CHECKING
+from llm import get_text_llm
+from case_store import CaseStore, render_case_file
+
+if TYPE_CHECKING:
+    from langchain_core.prompts import ChatPromptTemplate
 
 PATIENT_TEMPLATE = """
 您將扮演一個醫療案例中的病患。請您以第一人稱的視角回答問題，如同在描述自己的情況。
@@ -19,44 +21,39 @@ PATIENT_TEMPLATE = """
 {query}
 """
 
-def nested_dict_to_string(data_dict, indent=0):
-    """
-    將字典轉換為帶有縮排的字串。
-    """
-    lines = []
-    indent_space = '  ' * indent
-    for key, value in data_dict.items():
-        if isinstance(value, dict):
-            lines.append(f"{indent_space}{key}:")
-            lines.append(nested_dict_to_string(value, indent + 1))
-        else:
-            lines.append(f"{indent_space}{key}: {value}")
-    return '\n'.join(lines)
-
 class Patient:
     """
     一個用於醫療診斷對話的模擬病患。
     """
-    def __init__(self, case_file_path: str):
+    def __init__(self, case_file_path: str = None, case_content: str = None):
         """
         初始化代理。
         :param case_file_path: 案例檔案的路徑
+        :param case_content: 已渲染好的病歷字串（例如來自 CaseStore），提供時不讀取檔案
         """
-        if not os.path.exists(case_file_path):
-            raise FileNotFoundError(f"找不到檔案: {case_file_path}")
-        self.case_file_content = self._load_case_file(case_file_path)
+        if case_content is None:
+            if case_file_path is None:
+                raise ValueError("必須提供 case_file_path 或 case_content")
+            if not os.path.exists(case_file_path):
+                raise FileNotFoundError(f"找不到檔案: {case_file_path}")
+            case_content = self._load_case_file(case_file_path)
+        self.case_file_content = case_content
         self.prompt_template = self._get_prompt_template()
-        self.chain = self.prompt_template | llm | StrOutputParser()
+        from langchain_core.output_parsers import StrOutputParser
+        self.chain = self.prompt_template | get_text_llm() | StrOutputParser()
+
+    @classmethod
+    def from_store(cls, case_store: CaseStore, case_id: str) -> "Patient":
+        """
+        從 CaseStore 取出預先渲染好的病歷建立病患。
+        """
+        return cls(case_content=case_store.get(case_id))
 
     def _load_case_file(self, file_path: str) -> str:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            case_data = data["report"]
-            case_description = nested_dict_to_string(case_data)
-            print(case_description)
-        return case_description
+        return render_case_file(file_path)
 
-    def _get_prompt_template(self) -> ChatPromptTemplate:
+    def _get_prompt_template(self) -> "ChatPromptTemplate":
+        from langchain_core.prompts import ChatPromptTemplate
         template = PATIENT_TEMPLATE
         return ChatPromptTemplate.from_template(template)
 
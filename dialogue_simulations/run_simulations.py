@@ -3,6 +3,7 @@ import json
 import os
 from doctor import Doctor
 from patient import Patient
+from case_store import CaseStore
 import uuid
 
 def run_simulation(case_file_path: str, output_dir: str):
@@ -16,9 +17,30 @@ def run_simulation(case_file_path: str, output_dir: str):
         print(f"錯誤: 找不到病歷檔案 {case_file_path}")
         return
 
-    doctor = Doctor()
     patient = Patient(case_file_path=case_file_path)
+    _simulate(Doctor(), patient, output_dir)
+
+def run_simulations(case_dir: str, output_dir: str):
+    """
+    對目錄中的所有病歷執行對話模擬。
+    病歷只在建立索引時解析一次，之後依 case id 從 CaseStore 延遲讀取。
 
+    :param case_dir: 病歷 JSON 所在的目錄。
+    :param output_dir: 儲存對話紀錄的目錄。
+    """
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    # 索引檔與對話紀錄放在一起，不寫入病歷目錄
+    case_store = CaseStore.from_directory(case_dir, os.path.join(output_dir, 'cases.sqlite'))
+    doctor = Doctor()
+    try:
+        for case_id in case_store.case_ids():
+            print(f"--- 病歷 {case_id} ---")
+            _simulate(doctor, Patient.from_store(case_store, case_id), output_dir)
+    finally:
+        case_store.close()
+
+def _simulate(doctor: Doctor, patient: Patient, output_dir: str):
     dialogue = []
     turn_count = 0
     max_turns = 20
@@ -66,6 +88,6 @@ def run_simulation(case_file_path: str, output_dir: str):
     print(f"對話已儲存至 {output_path}")
 
 if __name__ == '__main__':
-    case_file = 'data/cbafe137-cd78-4c39-87af-82568b86d9ab.json'
+    case_directory = 'data'
     output_directory = 'simulations'
-    run_simulation(case_file_path=case_file, output_dir=output_directory)
+    run_simulations(case_dir=case_directory, output_dir=output_directory)
@@ -1,36 +1,23 @@
 import uuid
-import os
-from neo4j import GraphDatabase
-from qdrant_client import QdrantClient, models
-from dotenv import load_dotenv  
-from pydantic import BaseModel  
-from collections import defaultdict  
-from neo4j_graphrag.retrievers import QdrantNeo4jRetriever  
-from langchain_ollama import ChatOllama, OllamaEmbeddings
-
-load_dotenv('.env') 
-neo4j_uri = os.getenv("NEO4J_URI")
-neo4j_username = os.getenv("NEO4J_USERNAME")
-neo4j_password = os.getenv("NEO4J_PASSWORD")
-neo4j_driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_username, neo4j_password))
-
-qdrant_client = QdrantClient(host="localhost", port=6333)
-
-# model clients
-gemma3 = ChatOllama(base_url="http://10.65.51.226:11434",model="gemma3:12b",temperature=0.2)
-gemma3_json = gemma3.bind(format="json")
-emb_model = OllamaEmbeddings(base_url="http://10.65.51.226:11434", model="bge-m3:567m")
-# Output embedding dimension size of 1024
-
-class single(BaseModel):
-    """定義單一圖形關係的 Pydantic 模型"""
-    node: str  # 來源節點
-    target_node: str  # 目標節點
-    relationship: str  # 關係類型
-
-class GraphComponents(BaseModel):
-    """定義包含多個圖形關係的 Pydantic 模型"""
-    graph: list[single]  # 圖形關係列表
+from functools import lru_cache
+from clients import get_neo4j_driver, get_qdrant_client, get_gemma3_json, ollama_embeddings
+
+@lru_cache(maxsize=None)
+def get_graph_components_model():
+    """延遲建立 Pydantic 模型，避免匯入模組時載入 pydantic"""
+    from pydantic import BaseModel
+
+    class single(BaseModel):
+        """定義單一圖形關係的 Pydantic 模型"""
+        node: str  # 來源節點
+        target_node: str  # 目標節點
+        relationship: str  # 關係類型
+
+    class GraphComponents(BaseModel):
+        """定義包含多個圖形關係的 Pydantic 模型"""
+        graph: list[single]  # 圖形關係列表
+
+    return GraphComponents
 
 parser_prompt = """
 You are a precise graph relationship extractor. 
@@ -63,8 +50,8 @@ Only include relations of target medical entities.
 Here is the text:
 """
 def gemma3_llm_parser(user_prompt):
-    resp = gemma3_json.invoke(parser_prompt+user_prompt)
-    return GraphComponents.model_validate_json(resp.content)
+    resp = get_gemma3_json().invoke(parser_prompt+user_prompt)
+    return get_graph_components_model().model_validate_json(resp.content)
 
 def extract_graph_components(raw_data):
     parsed_response = gemma3_llm_parser(raw_data)
@@ -98,7 +85,7 @@ def extract_graph_components(raw_data):
 
 def ingest_to_neo4j(nodes, relationships):
     """將節點和關係匯入 Neo4j。"""
-    with neo4j_driver.session() as session:
+    with get_neo4j_driver().session() as session:
         for name, node_id in nodes.items():
             session.run(
                 "CREATE (n:Entity {id: $id, name: $name})",  # Cypher 查詢，建立 id 和 name 的 Entity 節點
@@ -117,11 +104,8 @@ def ingest_to_neo4j(nodes, relationships):
 
     return nodes
 
-def ollama_embeddings(text):
-    single_vector = emb_model.embed_query(text)
-    return single_vector
-
 def create_collection(client, collection_name, vector_dimension):
+    from qdrant_client import models
     try:
         collection_info = client.get_collection(collection_name)
         print(f"Skipping creating collection; '{collection_name}' already exists.")
@@ -141,7 +125,7 @@ def create_collection(client, collection_name, vector_dimension):
 def ingest_to_qdrant(collection_name, raw_data, node_id_mapping):
     embeddings = [ollama_embeddings(paragraph) for paragraph in raw_data.split("\n")]
 
-    qdrant_client.upsert(
+    get_qdrant_client().upsert(
         collection_name=collection_name,
         points=[
             {
@@ -157,7 +141,7 @@ def build_graph(raw_data):
     print("Creating collection...")
     collection_name = "grag_test"
     vector_dimension = 1024 
-    create_collection(qdrant_client, collection_name, vector_dimension)
+    create_collection(get_qdrant_client(), collection_name, vector_dimension)
     print("Collection created/verified")
     
     print("Extracting graph components...")
@@ -0,0 +1,41 @@
+"""
+build_graph.py 與 run_search.py 共用的資料庫與模型客戶端。
+所有客戶端都在第一次使用時才建立，匯入模組時不會連線，也不會載入 neo4j、qdrant_client 或 langchain_ollama。
+"""
+import os
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def get_neo4j_driver():
+    from dotenv import load_dotenv
+    from neo4j import GraphDatabase
+    load_dotenv('.env')
+    neo4j_uri = os.getenv("NEO4J_URI")
+    neo4j_username = os.getenv("NEO4J_USERNAME")
+    neo4j_password = os.getenv("NEO4J_PASSWORD")
+    return GraphDatabase.driver(neo4j_uri, auth=(neo4j_username, neo4j_password))
+
+@lru_cache(maxsize=None)
+def get_qdrant_client():
+    from qdrant_client import QdrantClient
+    return QdrantClient(host="localhost", port=6333)
+
+# model clients
+@lru_cache(maxsize=None)
+def get_gemma3():
+    from langchain_ollama import ChatOllama
+    return ChatOllama(base_url="http://10.65.51.226:11434",model="gemma3:12b",temperature=0.2)
+
+@lru_cache(maxsize=None)
+def get_gemma3_json():
+    return get_gemma3().bind(format="json")
+
+@lru_cache(maxsize=None)
+def get_emb_model():
+    # Output embedding dimension size of 1024
+    from langchain_ollama import OllamaEmbeddings
+    return OllamaEmbeddings(base_url="http://10.65.51.226:11434", model="bge-m3:567m")
+
+def ollama_embeddings(text):
+    single_vector = get_emb_model().embed_query(text)
+    return single_vector
@@ -1,35 +1,11 @@
-import uuid
-import os
-from neo4j import GraphDatabase
-from qdrant_client import QdrantClient, models
-from dotenv import load_dotenv  
-from pydantic import BaseModel  
-from collections import defaultdict  
-from neo4j_graphrag.retrievers import QdrantNeo4jRetriever  
-from langchain_ollama import ChatOllama, OllamaEmbeddings
-
-load_dotenv('.env')
-neo4j_uri = os.getenv("NEO4J_URI")
-neo4j_username = os.getenv("NEO4J_USERNAME")
-neo4j_password = os.getenv("NEO4J_PASSWORD")
-neo4j_driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_username, neo4j_password))
-qdrant_client = QdrantClient(host="localhost", port=6333)
+from clients import get_neo4j_driver, get_qdrant_client, get_gemma3, ollama_embeddings
 
 collection_name = "grag_test"  # Qdrant 集合名稱
 vector_dimension = 1024  # 嵌入向量的維度
 
-# model clients
-gemma3 = ChatOllama(base_url="http://10.65.51.226:11434",model="gemma3:12b",temperature=0.2)
-gemma3_json = gemma3.bind(format="json")
-emb_model = OllamaEmbeddings(base_url="http://10.65.51.226:11434", model="bge-m3:567m")
-# Output embedding dimension size of 1024
-
-def ollama_embeddings(text):
-    single_vector = emb_model.embed_query(text)
-    return single_vector
-
 def retriever_search(neo4j_driver, qdrant_client, collection_name, query):
     """使用 QdrantNeo4jRetriever 進行檢索"""
+    from neo4j_graphrag.retrievers import QdrantNeo4jRetriever
     retriever = QdrantNeo4jRetriever(
         driver=neo4j_driver,  # Neo4j 驅動程式
         client=qdrant_client,  # Qdrant 客戶端
@@ -112,13 +88,15 @@ def graphRAG_run(graph_context, user_query):
     User Query: "{user_query}"
     """
     try:
-        resp = gemma3.invoke(prompt)
+        resp = get_gemma3().invoke(prompt)
         return resp.content
     except Exception as e:
         return f"Error querying LLM: {str(e)}"
     
 if __name__ == "__main__":
     query = "如何治療白喉?"
+    neo4j_driver = get_neo4j_driver()
+    qdrant_client = get_qdrant_client()
     print("Starting retriever search...")
     # 進行檢索
     retriever_result = retriever_search(neo4j_driver, qdrant_client, collection_name, query)
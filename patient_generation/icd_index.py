@@ -0,0 +1,62 @@
+"""
+ICD-10-CM 代碼對照的精簡索引。
+先執行 `python icd_index.py` 把 icd10cm_mapping.json 轉成 SQLite 檔，
+之後每次查詢只讀取單一代碼，不需要把整份對照表載入記憶體。
+若索引不存在或比 JSON 舊，第一次查詢時會自動重建。
+"""
+import os
+import json
+import sqlite3
+import tempfile
+from functools import lru_cache
+
+ICD_MAPPING_PATH = "../data/icd10cm_mapping.json"
+ICD_INDEX_PATH = "../data/icd10cm_mapping.sqlite"
+
+def build_icd_index(mapping_path: str = ICD_MAPPING_PATH, index_path: str = ICD_INDEX_PATH):
+    """
+    由 JSON 對照表建立 SQLite 索引檔。
+    """
+    with open(mapping_path, "r") as reader:
+        mapping = json.load(reader)
+
+    # 每次建置使用各自的暫存檔，建好後再以 os.replace 原子地替換，
+    # 多個程序同時建置也不會互相覆寫，讀取端也不會看到寫到一半的索引
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(index_path)), suffix=".tmp")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.execute("CREATE TABLE icd (code TEXT PRIMARY KEY, description TEXT NOT NULL) WITHOUT ROWID")
+            conn.executemany("INSERT INTO icd (code, description) VALUES (?, ?)", sorted(mapping.items()))
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+@lru_cache(maxsize=None)
+def _connect(mapping_path: str = ICD_MAPPING_PATH, index_path: str = ICD_INDEX_PATH) -> sqlite3.Connection:
+    # 正常情況下索引已由 `python icd_index.py` 預先建好；這裡只在缺少或過期時補建
+    stale = not os.path.exists(index_path) or (
+        os.path.exists(mapping_path) and os.path.getmtime(mapping_path) > os.path.getmtime(index_path)
+    )
+    if stale:
+        build_icd_index(mapping_path, index_path)
+    return sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+
+def icd_lookup(code: str) -> str:
+    """
+    查詢 ICD 代碼對應的疾病描述，找不到時丟出 KeyError。
+    """
+    row = _connect().execute("SELECT description FROM icd WHERE code = ?", (code,)).fetchone()
+    if row is None:
+        raise KeyError(code)
+    return row[0]
+
+if __name__ == "__main__":
+    build_icd_index()
+    print(f"ICD index written to {ICD_INDEX_PATH}")
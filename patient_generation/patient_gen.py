@@ -1,15 +1,15 @@
 import os
 import json
 import uuid
-from ollama import Client
+from functools import lru_cache
 from typing import Union, List, Optional
-from langchain_ollama import ChatOllama
+from icd_index import icd_lookup
 
-gemma3 = ChatOllama(base_url="http://10.65.51.226:11434",model="gemma3:4b",temperature=0.7)
-gemma3_json = gemma3.bind(format="json")
-
-with open("../data/icd10cm_mapping.json", "r") as reader:
-    ICD_MAPPING = json.load(reader)
+@lru_cache(maxsize=None)
+def get_gemma3_json():
+    from langchain_ollama import ChatOllama
+    gemma3 = ChatOllama(base_url="http://10.65.51.226:11434",model="gemma3:4b",temperature=0.7)
+    return gemma3.bind(format="json")
 
 def generate_virtual_patient_single(diagnosis: str) -> Optional[dict]:
     """
@@ -43,7 +43,7 @@ def generate_virtual_patient_single(diagnosis: str) -> Optional[dict]:
     required_keys = ["基本背景", "過去病史與危險因子", "現病史與症狀", "臨床檢查與檢驗", "治療與病程", "預後與後續計畫"]
     for attempt in range(3):
         try:
-            resp = gemma3_json.invoke(prompt)
+            resp = get_gemma3_json().invoke(prompt)
             case_report = json.loads(resp.content)
             if all(key in case_report for key in required_keys):
                 return case_report
@@ -67,7 +67,7 @@ if __name__ == "__main__":
     for icd_codes in icd_collections:
         diagnosis = ""
         for code in icd_codes:
-            diagnosis += f"{ICD_MAPPING[code]} "
+            diagnosis += f"{icd_lookup(code)} "
         print(diagnosis)
         
         case_report = generate_virtual_patient_single(diagnosis)